@@ -28,8 +28,9 @@ class PostgresConfig(BaseModel):
     db: str = ''
     database_uri: str = ''
     test_database_uri: str = ''
-    pool_size: int = 40
-    overflow_pool_size: int = 40
+    pool_size: int = 5
+    overflow_pool_size: int = 10
+    jit: bool = False  # JIT Postgres замедляет короткие OLTP-запросы
 
     @model_validator(mode='before')
     @classmethod
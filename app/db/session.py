@@ -1,7 +1,9 @@
 """Асинхронное подключение к PostgreSQL."""
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine
@@ -25,18 +27,47 @@ class DBConnector:
         else:
             self.db_url = config.postgres.database_uri
 
+        self._engine: AsyncEngine | None = None
+        self._session_maker: async_sessionmaker | None = None
+
     def get_db_engine(self, db_url: str) -> AsyncEngine:
         """Создать движок подключения к Postgres."""
-        engine = create_async_engine(url=db_url)
+        url = make_url(db_url)
+        engine_kwargs: dict[str, Any] = {}
+        connect_args: dict[str, Any] = {}
+
+        # Размеры пула применимы только к QueuePool Postgres, у SQLite другие пулы
+        if url.get_backend_name() == 'postgresql':
+            engine_kwargs['pool_size'] = config.postgres.pool_size
+            engine_kwargs['max_overflow'] = config.postgres.overflow_pool_size
+
+        # server_settings поддерживает только драйвер asyncpg
+        if url.get_driver_name() == 'asyncpg':
+            connect_args['server_settings'] = {'jit': 'on' if config.postgres.jit else 'off'}
+
+        engine = create_async_engine(url=url, connect_args=connect_args, **engine_kwargs)
         return engine
 
     def get_session_maker(self) -> async_sessionmaker:
-        """Создать фабрику асинхронных сессий."""
-        return async_sessionmaker(
-            bind=self.get_db_engine(db_url=self.db_url),
-            expire_on_commit=False,
-            autoflush=False,
-        )
+        """Получить фабрику асинхронных сессий.
+
+        Движок и фабрика создаются один раз, все сессии работают через общий пул соединений.
+        """
+        if self._session_maker is None:
+            self._engine = self.get_db_engine(db_url=self.db_url)
+            self._session_maker = async_sessionmaker(
+                bind=self._engine,
+                expire_on_commit=False,
+                autoflush=False,
+            )
+        return self._session_maker
+
+    async def dispose(self) -> None:
+        """Закрыть соединения пула и сбросить движок."""
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+            self._session_maker = None
 
     async def get_session(self) -> AsyncGenerator:
         """Получить сессию БД для dependency injection.
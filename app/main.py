@@ -1,14 +1,29 @@
 """FastAPI приложение c системой аутентификации и авторизации."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import uvicorn
 
 from fastapi import FastAPI
 
 from app.api.router import main_router as main_router
 from app.config import config
+from app.db.session import connector
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Жизненный цикл приложения.
+
+    Пул соединений с БД живет все время работы приложения и закрывается при остановке.
+    """
+    yield
+    await connector.dispose()
+
 
 # Fastapi. Запускаем приложение.
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.include_router(main_router)
 
 if __name__ == '__main__':